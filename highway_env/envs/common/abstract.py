@@ -113,6 +113,30 @@ class AbstractEnv(gym.Env):
         if config:
             self.config.update(config)
 
+    @classmethod
+    def make_vec(cls, n_envs: int, vectorize: str = "async", config: dict = None, copy: bool = True) \
+            -> gym.vector.VectorEnv:
+        """
+        Create a vectorized environment running several copies of this environment.
+
+        With asynchronous vectorization, each copy runs in its own process and observations are written into shared
+        memory, which avoids pickling them at every step. The throughput scales almost linearly with the number of
+        copies up to the number of physical cores, beyond which the returns quickly diminish.
+
+        :param n_envs: the number of copies of the environment
+        :param vectorize: "async" to run the copies in subprocesses, or "sync" to run them sequentially
+        :param config: the configuration shared by all the copies
+        :param copy: whether the batched observations are copied, rather than returned as views on a buffer that is
+                     overwritten at the next step
+        :return: the vectorized environment
+        """
+        env_fns = [lambda: cls(config) for _ in range(n_envs)]
+        if vectorize == "async":
+            return gym.vector.AsyncVectorEnv(env_fns, shared_memory=True, copy=copy)
+        elif vectorize == "sync":
+            return gym.vector.SyncVectorEnv(env_fns, copy=copy)
+        raise ValueError("Unknown vectorization mode {}".format(vectorize))
+
     def update_metadata(self, video_real_time_ratio=2):
         frames_freq = self.config["simulation_frequency"] \
             if self._record_video_wrapper else self.config["policy_frequency"]
@@ -3,7 +3,6 @@ from itertools import product
 from typing import List, Dict, TYPE_CHECKING, Optional, Union, Tuple
 from gymnasium import spaces
 import numpy as np
-import pandas as pd
 
 from highway_env import utils
 from highway_env.envs.common.finite_mdp import compute_ttc_grid
@@ -14,6 +13,7 @@ from highway_env.vehicle.controller import MDPVehicle
 from highway_env.vehicle.kinematics import Vehicle
 
 if TYPE_CHECKING:
+    import pandas as pd
     from highway_env.envs.common.abstract import AbstractEnv
 
 
@@ -180,7 +180,21 @@ class KinematicObservation(ObservationType):
     def space(self) -> spaces.Space:
         return spaces.Box(shape=(self.vehicles_count, len(self.features)), low=-np.inf, high=np.inf, dtype=np.float32)
 
-    def normalize_obs(self, df: pd.DataFrame) -> pd.DataFrame:
+    def default_features_range(self) -> Dict[str, List[float]]:
+        """
+        Default ranges of the normalized features.
+
+        For now, assume that the road is straight along the x axis.
+        """
+        side_lanes = self.env.road.network.all_side_lanes(self.observer_vehicle.lane_index)
+        return {
+            "x": [-5.0 * Vehicle.MAX_SPEED, 5.0 * Vehicle.MAX_SPEED],
+            "y": [-AbstractLane.DEFAULT_WIDTH * len(side_lanes), AbstractLane.DEFAULT_WIDTH * len(side_lanes)],
+            "vx": [-2*Vehicle.MAX_SPEED, 2*Vehicle.MAX_SPEED],
+            "vy": [-2*Vehicle.MAX_SPEED, 2*Vehicle.MAX_SPEED]
+        }
+
+    def normalize_obs(self, df: 'pd.DataFrame') -> 'pd.DataFrame':
         """
         Normalize the observation values.
 
@@ -188,13 +202,7 @@ class KinematicObservation(ObservationType):
         :param Dataframe df: observation data
         """
         if not self.features_range:
-            side_lanes = self.env.road.network.all_side_lanes(self.observer_vehicle.lane_index)
-            self.features_range = {
-                "x": [-5.0 * Vehicle.MAX_SPEED, 5.0 * Vehicle.MAX_SPEED],
-                "y": [-AbstractLane.DEFAULT_WIDTH * len(side_lanes), AbstractLane.DEFAULT_WIDTH * len(side_lanes)],
-                "vx": [-2*Vehicle.MAX_SPEED, 2*Vehicle.MAX_SPEED],
-                "vy": [-2*Vehicle.MAX_SPEED, 2*Vehicle.MAX_SPEED]
-            }
+            self.features_range = self.default_features_range()
         for feature, f_range in self.features_range.items():
             if feature in df:
                 df[feature] = utils.lmap(df[feature], [f_range[0], f_range[1]], [-1, 1])
@@ -202,12 +210,29 @@ class KinematicObservation(ObservationType):
                     df[feature] = np.clip(df[feature], -1, 1)
         return df
 
+    def normalize_array(self, obs: np.ndarray) -> np.ndarray:
+        """
+        Normalize the observation values, in place.
+
+        Same as normalize_obs(), for an array with one column per observed feature.
+        :param obs: observation data
+        """
+        if not self.features_range:
+            self.features_range = self.default_features_range()
+        for feature, f_range in self.features_range.items():
+            if feature in self.features:
+                column = self.features.index(feature)
+                obs[:, column] = utils.lmap(obs[:, column], [f_range[0], f_range[1]], [-1, 1])
+                if self.clip:
+                    obs[:, column] = np.clip(obs[:, column], -1, 1)
+        return obs
+
     def observe(self) -> np.ndarray:
         if not self.env.road:
-            return np.zeros(self.space().shape)
+            return np.zeros(self.space().shape, dtype=self.space().dtype)
 
         # Add ego-vehicle
-        df = pd.DataFrame.from_records([self.observer_vehicle.to_dict()])
+        records = [self.observer_vehicle.to_dict()]
         # Add nearby traffic
         close_vehicles = self.env.road.close_objects_to(self.observer_vehicle,
                                                         self.env.PERCEPTION_DISTANCE,
@@ -217,27 +242,20 @@ class KinematicObservation(ObservationType):
                                                         vehicles_only=not self.include_obstacles)
         if close_vehicles:
             origin = self.observer_vehicle if not self.absolute else None
-            vehicles_df = pd.DataFrame.from_records(
-                [v.to_dict(origin, observe_intentions=self.observe_intentions)
-                 for v in close_vehicles[-self.vehicles_count + 1:]])
-            df = pd.concat([df, vehicles_df], ignore_index=True)
+            # With a single observed vehicle, count=0 does not limit the close vehicles: cap them explicitly
+            records += [v.to_dict(origin, observe_intentions=self.observe_intentions)
+                        for v in close_vehicles[:self.vehicles_count - 1]]
 
-        df = df[self.features]
+        # Fill the observed rows, missing rows are left to zero
+        obs = np.zeros((self.vehicles_count, len(self.features)), dtype=self.space().dtype)
+        obs[:len(records)] = [[record.get(feature, np.nan) for feature in self.features] for record in records]
 
         # Normalize and clip
         if self.normalize:
-            df = self.normalize_obs(df)
-        # Fill missing rows
-        if df.shape[0] < self.vehicles_count:
-            rows = np.zeros((self.vehicles_count - df.shape[0], len(self.features)))
-            df = pd.concat([df, pd.DataFrame(data=rows, columns=self.features)], ignore_index=True)
-        # Reorder
-        df = df[self.features]
-        obs = df.values.copy()
+            self.normalize_array(obs[:len(records)])
         if self.order == "shuffled":
             self.env.np_random.shuffle(obs[1:])
-        # Flatten
-        return obs.astype(self.space().dtype)
+        return obs
 
 
 class OccupancyGridObservation(ObservationType):
@@ -289,7 +307,7 @@ class OccupancyGridObservation(ObservationType):
         else:
             return spaces.Box(shape=self.grid.shape, low=-np.inf, high=np.inf, dtype=np.float32)
 
-    def normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+    def normalize(self, df: 'pd.DataFrame') -> 'pd.DataFrame':
         """
         Normalize the observation values.
 
@@ -307,8 +325,9 @@ class OccupancyGridObservation(ObservationType):
         return df
 
     def observe(self) -> np.ndarray:
+        import pandas as pd  # Slow to import, and not needed by the default Kinematics observation
         if not self.env.road:
-            return np.zeros(self.space().shape)
+            return np.zeros(self.space().shape, dtype=self.space().dtype)
 
         if self.absolute:
             raise NotImplementedError()
@@ -438,6 +457,7 @@ class KinematicsGoalObservation(KinematicObservation):
             return spaces.Space()
 
     def observe(self) -> Dict[str, np.ndarray]:
+        import pandas as pd
         if not self.observer_vehicle:
             return OrderedDict([
                 ("observation", np.zeros((len(self.features),))),
@@ -516,8 +536,9 @@ class ExitObservation(KinematicObservation):
     """Specific to exit_env, observe the distance to the next exit lane as part of a KinematicObservation."""
 
     def observe(self) -> np.ndarray:
+        import pandas as pd
         if not self.env.road:
-            return np.zeros(self.space().shape)
+            return np.zeros(self.space().shape, dtype=self.space().dtype)
 
         # Add ego-vehicle
         ego_dict = self.observer_vehicle.to_dict()
@@ -545,7 +566,7 @@ class ExitObservation(KinematicObservation):
             df = pd.concat([df, pd.DataFrame(data=rows, columns=self.features)], ignore_index=True)
         # Reorder
         df = df[self.features]
-        obs = df.values.copy()
+        obs = df.values.astype(self.space().dtype)
         if self.order == "shuffled":
             self.env.np_random.shuffle(obs[1:])
         # Flatten
@@ -5,7 +5,6 @@ from highway_env import utils
 from highway_env.envs import HighwayEnv, CircularLane, Vehicle
 from highway_env.envs.common.action import Action
 from highway_env.road.road import Road, RoadNetwork
-from highway_env.vehicle.controller import ControlledVehicle
 
 
 class ExitEnv(HighwayEnv):
@@ -118,8 +117,7 @@ class ExitEnv(HighwayEnv):
         return reward
 
     def _rewards(self, action: Action) -> Dict[Text, float]:
-        lane_index = self.vehicle.target_lane_index if isinstance(self.vehicle, ControlledVehicle) \
-            else self.vehicle.lane_index
+        lane_index = self.vehicle.effective_lane_index
         scaled_speed = utils.lmap(self.vehicle.speed, self.config["reward_speed_range"], [0, 1])
         return {
             "collision_reward": self.vehicle.crashed,
@@ -129,8 +127,7 @@ class ExitEnv(HighwayEnv):
         }
 
     def _is_success(self):
-        lane_index = self.vehicle.target_lane_index if isinstance(self.vehicle, ControlledVehicle) \
-            else self.vehicle.lane_index
+        lane_index = self.vehicle.effective_lane_index
         goal_reached = lane_index == ("1", "2", self.config["lanes_count"]) or lane_index == ("2", "exit", 0)
         return goal_reached
 
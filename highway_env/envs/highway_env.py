@@ -7,7 +7,6 @@ from highway_env.envs.common.abstract import AbstractEnv
 from highway_env.envs.common.action import Action
 from highway_env.road.road import Road, RoadNetwork
 from highway_env.utils import near_split
-from highway_env.vehicle.controller import ControlledVehicle
 from highway_env.vehicle.kinematics import Vehicle
 
 import math  ### Modification ###
@@ -15,6 +14,39 @@ import math  ### Modification ###
 Observation = np.ndarray
 
 
+def _clip01(x: float) -> float:
+    """Clip a scalar to [0, 1], without the overhead of np.clip on non-array values."""
+    return 0. if x < 0. else 1. if x > 1. else x
+
+
+def _energy_consumption_reward(speed: float, heading: float, offset: float, scale: float) -> float:
+    """
+    Energy consumption model, normalized to [0, 1].
+
+    :param speed: the vehicle speed [m/s]
+    :param heading: the vehicle heading [rad]
+    :param offset: the lower bound of the energy consumption range
+    :param scale: the inverse width of the energy consumption range
+    :return: the energy consumption reward
+    """
+    # The speed can become negative when reversing, which is outside of the domain of the square root
+    energy_consumption = math.sqrt(max(speed + heading**2, 0.))
+    return _clip01((energy_consumption - offset) * scale)
+
+
+def _front_distance_reward(front_distance: float, max_distance: float, offset: float, scale: float) -> float:
+    """
+    Distance to the front vehicle, saturated and normalized to [0, 1].
+
+    :param front_distance: the distance to the front vehicle [m]
+    :param max_distance: the distance above which the reward is saturated [m]
+    :param offset: the lower bound of the front distance range [m]
+    :param scale: the inverse width of the front distance range [1/m]
+    :return: the front distance reward
+    """
+    return _clip01((min(front_distance, max_distance) - offset) * scale)
+
+
 class HighwayEnv(AbstractEnv):
     """
     A highway driving environment.
@@ -23,6 +55,9 @@ class HighwayEnv(AbstractEnv):
     staying on the rightmost lanes and avoiding collisions.
     """
 
+    MINIMUM_SAFE_DISTANCE = 30.
+    """ Front distance above which the front distance reward is saturated [m] """
+
     @classmethod
     def default_config(cls) -> dict:
         config = super().default_config()
@@ -63,6 +98,28 @@ class HighwayEnv(AbstractEnv):
     def _reset(self) -> None:
         self._create_road()
         self._create_vehicles()
+        self._cache_reward_config()
+        self._duration = float(self.config["duration"])
+        self._offroad_terminal = bool(self.config["offroad_terminal"])
+
+    def _cache_reward_config(self) -> None:
+        """
+        Read the reward configuration once per episode, rather than at every step.
+
+        The affine maps used to normalize the rewards are stored as (offset, scale) pairs, a specialization of
+        utils.lmap to a target range of [0, 1].
+        """
+        # Reward terms with a null weight are not computed
+        self._reward_weights = {name: float(weight) for name, weight in self.config.items()
+                                if name.endswith("_reward") and name != "normalize_reward" and weight}
+        self._normalize_reward = bool(self.config["normalize_reward"])
+        # Only the ranges that are used are mapped, as unused ones may be degenerate
+        ranges = {name: self.config[name + "_range"] for name in ["energy_consumption", "front_distance"]
+                  if name + "_reward" in self._reward_weights}
+        if self._normalize_reward:
+            ranges["reward"] = [self.config["collision_reward"],
+                                self.config["high_speed_reward"] + self.config["right_lane_reward"]]
+        self._reward_scales = {name: (x[0], 1 / (x[1] - x[0])) for name, x in ranges.items()}
 
     def _create_road(self) -> None:
         """Create a road composed of straight adjacent lanes."""
@@ -87,9 +144,18 @@ class HighwayEnv(AbstractEnv):
             self.road.vehicles.append(vehicle)
 
             for _ in range(others):
-                vehicle = other_vehicles_type.create_random(self.road, spacing=1 / self.config["vehicles_density"])
-                vehicle.randomize_behavior()
-                self.road.vehicles.append(vehicle)
+                self.road.vehicles.append(self._create_other_vehicle(other_vehicles_type))
+
+    def _create_other_vehicle(self, vehicle_class: type) -> Vehicle:
+        """
+        Create a new random uncontrolled vehicle, behind the vehicles already on the road.
+
+        :param vehicle_class: the class of the uncontrolled vehicle
+        :return: the new vehicle
+        """
+        vehicle = vehicle_class.create_random(self.road, spacing=1 / self.config["vehicles_density"])
+        vehicle.randomize_behavior()
+        return vehicle
 
     def _reward(self, action: Action) -> float:
         """
@@ -98,69 +164,58 @@ class HighwayEnv(AbstractEnv):
         :return: the corresponding reward
         """
         rewards = self._rewards(action)
-        reward = sum(self.config.get(name, 0) * reward for name, reward in rewards.items())
-        
-        # Debugging Purpose
-        # for a in rewards.items():
-        #     if a[0] == "energy_consumption_reward":
-        #         print(a)
-        
+        reward = 0.
+        for name, value in rewards.items():
+            reward += self._reward_weights.get(name, 0.) * value
+
         # Change the range to include Energy Consumption Model
-        if self.config["normalize_reward"]:
-            reward = utils.lmap(reward,
-                                [self.config["collision_reward"],
-                                 self.config["high_speed_reward"] + self.config["right_lane_reward"]],
-                                [0, 1])
+        if self._normalize_reward:
+            offset, scale = self._reward_scales["reward"]
+            reward = (reward - offset) * scale
         # reward *= rewards['on_road_reward']
         return reward
 
     def _rewards(self, action: Action) -> Dict[Text, float]:
-        # neighbours = self.road.network.all_side_lanes(self.vehicle.lane_index)
-        # lane = self.vehicle.target_lane_index[2] if isinstance(self.vehicle, ControlledVehicle) \
-        #     else self.vehicle.lane_index[2]
+        # lane = self.vehicle.effective_lane_index[2]
         # Use forward speed rather than speed, see https://github.com/eleurent/highway-env/issues/268
         # forward_speed = self.vehicle.speed * np.cos(self.vehicle.heading)
         # scaled_speed = utils.lmap(forward_speed, self.config["reward_speed_range"], [0, 1])
         
         ### Modification ###
-        
+        rewards = {}
+        if "collision_reward" in self._reward_weights:
+            rewards["collision_reward"] = float(self.vehicle.crashed)
+
         # Energy Consumption Model
-        energy_consumption = math.sqrt(self.vehicle.speed + self.vehicle.heading**2)
-        # Normalization
-        energy_consumption = utils.lmap(energy_consumption, self.config["energy_consumption_range"], [0, 1])
-        
+        if "energy_consumption_reward" in self._reward_weights:
+            rewards["energy_consumption_reward"] = _energy_consumption_reward(
+                float(self.vehicle.speed), float(self.vehicle.heading), *self._reward_scales["energy_consumption"])
+
         # speed_range_reward
-        
-        
+
         # front_distance_reward
-        front_vehicle, _ = self.road.neighbour_vehicles(self.vehicle, self.vehicle.lane_index)
-        front_distance = self.vehicle.lane_distance_to(front_vehicle)
-        minimum_safe_distance = 30
-        if front_distance > minimum_safe_distance:
-            front_distance = minimum_safe_distance
-        # Normalization
-        front_distance = utils.lmap(front_distance, self.config["front_distance_range"], [0, 1])
+        if "front_distance_reward" in self._reward_weights:
+            front_vehicle, _ = self.road.neighbour_vehicles(self.vehicle, self.vehicle.lane_index)
+            # Without any front vehicle, the distance is undefined (NaN): consider the road ahead as free
+            front_distance = self.vehicle.lane_distance_to(front_vehicle) if front_vehicle \
+                else self.MINIMUM_SAFE_DISTANCE
+            rewards["front_distance_reward"] = _front_distance_reward(
+                front_distance, self.MINIMUM_SAFE_DISTANCE, *self._reward_scales["front_distance"])
         ###
-        
-        
-        return {
-            "collision_reward": float(self.vehicle.crashed),
-            # "right_lane_reward": lane / max(len(neighbours) - 1, 1),
-            # "high_speed_reward": np.clip(scaled_speed, 0, 1),
-            # "on_road_reward": float(self.vehicle.on_road),
-            "energy_consumption_reward": float(energy_consumption),  ### Modification ###
-            # "speed_range_reward": float(speed_range),
-            "front_distance_reward": float(front_distance)
-        }
+
+        # "high_speed_reward": np.clip(scaled_speed, 0, 1),
+        # "on_road_reward": float(self.vehicle.on_road),
+        # "speed_range_reward": float(speed_range),
+        return rewards
 
     def _is_terminated(self) -> bool:
         """The episode is over if the ego vehicle crashed."""
         return (self.vehicle.crashed or
-                self.config["offroad_terminal"] and not self.vehicle.on_road)
+                self._offroad_terminal and not self.vehicle.on_road)
 
     def _is_truncated(self) -> bool:
         """The episode is truncated if the time limit is reached."""
-        return self.time >= self.config["duration"]
+        return self.time >= self._duration
 
 
 class HighwayEnvFast(HighwayEnv):
@@ -182,9 +237,8 @@ class HighwayEnvFast(HighwayEnv):
         })
         return cfg
 
-    def _create_vehicles(self) -> None:
-        super()._create_vehicles()
+    def _create_other_vehicle(self, vehicle_class: type) -> Vehicle:
+        vehicle = super()._create_other_vehicle(vehicle_class)
         # Disable collision check for uncontrolled vehicles
-        for vehicle in self.road.vehicles:
-            if vehicle not in self.controlled_vehicles:
-                vehicle.check_collisions = False
+        vehicle.check_collisions = False
+        return vehicle
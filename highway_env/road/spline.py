@@ -1,5 +1,4 @@
 import numpy as np
-from scipy import interpolate
 from typing import List, Tuple
 
 
@@ -11,6 +10,7 @@ class LinearSpline2D:
     PARAM_CURVE_SAMPLE_DISTANCE: int = 1  # curve samples are placed 1m apart
 
     def __init__(self, points: List[Tuple[float, float]]):
+        from scipy import interpolate  # Slow to import, and only needed by the few polyline lanes
         x_values = np.array([pt[0] for pt in points])
         y_values = np.array([pt[1] for pt in points])
         x_values_diff = np.diff(x_values)
@@ -1,4 +1,5 @@
 import copy
+import functools
 import importlib
 import itertools
 from typing import Tuple, Dict, Callable, List, Optional, Union, Sequence
@@ -30,6 +31,7 @@ def get_class_path(cls: Callable) -> str:
     return cls.__module__ + "." + cls.__qualname__
 
 
+@functools.lru_cache(maxsize=None)
 def class_from_path(path: str) -> Callable:
     module_name, class_name = path.rsplit(".", 1)
     class_object = getattr(importlib.import_module(module_name), class_name)
@@ -1,5 +1,6 @@
 from typing import List, Tuple, Union, Optional
 
+import math
 import numpy as np
 import copy
 from highway_env import utils
@@ -182,17 +183,18 @@ class ControlledVehicle(Vehicle):
         lane_next_coords = lane_coords[0] + self.speed * self.TAU_PURSUIT
         lane_future_heading = target_lane.heading_at(lane_next_coords)  # 0 always for straight lane
         
+        # The math module is used rather than NumPy, whose ufuncs are much slower on single floats
         # Lateral position control
         lateral_speed_command = - self.KP_LATERAL * lane_coords[1]
         # Lateral speed to heading
-        heading_command = np.arcsin(np.clip(lateral_speed_command / utils.not_zero(self.speed), -1, 1))
-        heading_ref = lane_future_heading + np.clip(heading_command, -np.pi/4, np.pi/4)
+        heading_command = math.asin(min(max(lateral_speed_command / utils.not_zero(self.speed), -1), 1))
+        heading_ref = lane_future_heading + min(max(heading_command, -math.pi/4), math.pi/4)
         # Heading control
         heading_rate_command = self.KP_HEADING * utils.wrap_to_pi(heading_ref - self.heading)
         # Heading rate to steering angle
-        slip_angle = np.arcsin(np.clip(self.LENGTH / 2 / utils.not_zero(self.speed) * heading_rate_command, -1, 1))
-        steering_angle = np.arctan(2 * np.tan(slip_angle))
-        steering_angle = np.clip(steering_angle, -self.MAX_STEERING_ANGLE, self.MAX_STEERING_ANGLE)
+        slip_angle = math.asin(min(max(self.LENGTH / 2 / utils.not_zero(self.speed) * heading_rate_command, -1), 1))
+        steering_angle = math.atan(2 * math.tan(slip_angle))
+        steering_angle = min(max(steering_angle, -self.MAX_STEERING_ANGLE), self.MAX_STEERING_ANGLE)
         return float(steering_angle)
 
     def speed_control(self, target_speed: float) -> float:
@@ -239,6 +241,10 @@ class ControlledVehicle(Vehicle):
                 _to = self.road.np_random.randint(len(routes))
             self.route = routes[_to % len(routes)]
 
+    @property
+    def effective_lane_index(self) -> LaneIndex:
+        return self.target_lane_index
+
     def predict_trajectory_constant_speed(self, times: np.ndarray) -> Tuple[List[np.ndarray], List[float]]:
         """
         Predict the future positions of the vehicle along its planned route, under constant speed
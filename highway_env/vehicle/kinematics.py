@@ -5,6 +5,7 @@ from collections import deque
 
 from highway_env import utils
 from highway_env.road.road import Road, LaneIndex
+from highway_env.road.lane import StraightLane
 from highway_env.vehicle.objects import RoadObject, Obstacle, Landmark
 from highway_env.utils import Vector
 
@@ -78,8 +79,14 @@ class Vehicle(RoadObject):
                 speed = road.np_random.uniform(Vehicle.DEFAULT_INITIAL_SPEEDS[0], Vehicle.DEFAULT_INITIAL_SPEEDS[1])
         default_spacing = 12+1.0*speed
         offset = spacing * default_spacing * np.exp(-5 / 40 * len(road.network.graph[_from][_to]))
-        x0 = np.max([lane.local_coordinates(v.position)[0] for v in road.vehicles]) \
-            if len(road.vehicles) else 3*offset
+        if not len(road.vehicles):
+            x0 = 3*offset
+        elif isinstance(lane, StraightLane):
+            # Project all the vehicles on the lane at once rather than one by one
+            positions = np.array([v.position for v in road.vehicles])
+            x0 = np.max((positions - lane.start) @ lane.direction)
+        else:
+            x0 = np.max([lane.local_coordinates(v.position)[0] for v in road.vehicles])
         x0 += offset * road.np_random.uniform(0.9, 1.1)
         v = cls(road, lane.position(x0, 0), lane.heading_at(x0), speed)
         return v
@@ -174,6 +181,11 @@ class Vehicle(RoadObject):
     def velocity(self) -> np.ndarray:
         return self.speed * self.direction  # TODO: slip angle beta should be used here
 
+    @property
+    def effective_lane_index(self) -> LaneIndex:
+        """The lane that the vehicle is driving on, or heading to if it is controlled."""
+        return self.lane_index
+
     @property
     def destination(self) -> np.ndarray:
         if getattr(self, "route", None):
@@ -42,3 +42,13 @@ def test_env_reset_options(env_spec: str = "highway-v0"):
     update_duration = default_duration * 2
     env.reset(options={"config": {"duration": update_duration}})
     assert env.config["duration"] == update_duration
+
+
+@pytest.mark.parametrize("vectorize", ["sync", "async"])
+def test_make_vec(vectorize: str, n_envs: int = 2):
+    env = HighwayEnv.make_vec(n_envs, vectorize=vectorize, config={"duration": 2})
+    obs, info = env.reset(seed=0)
+    assert obs.shape[0] == n_envs
+    obs, reward, terminated, truncated, info = env.step(env.action_space.sample())
+    assert reward.shape == (n_envs,)
+    env.close()
@@ -0,0 +1,52 @@
+import gymnasium as gym
+import numpy as np
+import highway_env
+
+highway_env.register_highway_envs()
+
+
+def assert_rewards_in_range(reward, info):
+    assert np.isfinite(reward) and 0 <= reward <= 1
+    for value in info["rewards"].values():
+        assert np.isfinite(value) and 0 <= value <= 1
+
+
+def test_reward_without_front_vehicle():
+    env = gym.make("highway-v0")
+    env.configure({"vehicles_count": 0})
+    env.reset()
+    for _ in range(3):
+        _, reward, _, _, info = env.step(env.action_space.sample())
+        assert_rewards_in_range(reward, info)
+    env.close()
+
+
+def test_reward_with_negative_speed():
+    env = gym.make("highway-v0")
+    env.configure({"vehicles_count": 0, "action": {"type": "ContinuousAction"}})
+    env.reset()
+    env.unwrapped.vehicle.speed = -5
+    _, reward, _, _, info = env.step(np.zeros(env.action_space.shape))
+    assert env.unwrapped.vehicle.speed < 0
+    assert_rewards_in_range(reward, info)
+    env.close()
+
+
+def test_reward_without_normalization():
+    env = gym.make("highway-v0")
+    env.configure({"collision_reward": 0, "high_speed_reward": 0, "right_lane_reward": 0, "normalize_reward": False,
+                   "front_distance_range": [0, 0], "front_distance_reward": 0})
+    env.reset()
+    _, reward, _, _, info = env.step(env.action_space.sample())
+    assert np.isfinite(reward)
+    assert set(info["rewards"]) == {"energy_consumption_reward"}
+    env.close()
+
+
+def test_observation_single_vehicle():
+    env = gym.make("highway-v0")
+    env.configure({"observation": {"type": "Kinematics", "vehicles_count": 1}})
+    obs, _ = env.reset()
+    assert obs.shape == (1, len(env.unwrapped.observation_type.features))
+    assert env.observation_space.contains(obs)
+    env.close()
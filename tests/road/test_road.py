@@ -4,6 +4,7 @@ import pytest
 from highway_env.road.lane import StraightLane, CircularLane, PolyLane
 from highway_env.road.road import Road, RoadNetwork
 from highway_env.vehicle.controller import ControlledVehicle
+from highway_env.vehicle.kinematics import Vehicle
 
 
 @pytest.fixture
@@ -40,6 +41,17 @@ def test_network(net):
     assert lane_changes >= 3
 
 
+def test_neighbour_vehicles():
+    road = Road(network=RoadNetwork.straight_road_network(lanes=2))
+    ego = Vehicle(road, [50, 0])
+    front, far_front, rear, other_lane = Vehicle(road, [70, 0.5]), Vehicle(road, [90, 0]), \
+        Vehicle(road, [30, -0.5]), Vehicle(road, [60, 4])
+    road.vehicles.extend([far_front, other_lane, ego, rear, front])
+    assert road.neighbour_vehicles(ego) == (front, rear)
+    assert road.neighbour_vehicles(ego, ("0", "1", 1)) == (other_lane, None)
+    assert road.neighbour_vehicles(front) == (far_front, ego)
+
+
 def test_network_to_from_config(net):
     config_dict = net.to_config()
     net_2 = RoadNetwork.from_config(config_dict)